@@ -0,0 +1,31 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def min_euclidean_dist(X, S, out):
+    """Compute the euclidean distance from each sample to its nearest row
+    of ``S``.
+
+    The minimum is fused into the distance loop, so no
+    (n_samples, n_subsamples) matrix is ever allocated and the rows of
+    ``X`` are processed in parallel.
+    """
+
+    n_samples, n_features = X.shape
+    n_subsamples, _       = S.shape
+
+    for i in prange(n_samples):
+        best = np.inf
+
+        for j in range(n_subsamples):
+            dist_sq = 0.
+
+            for k in range(n_features):
+                d        = X[i, k] - S[j, k]
+                dist_sq += d * d
+
+            if dist_sq < best:
+                best = dist_sq
+
+        out[i] = np.sqrt(best)
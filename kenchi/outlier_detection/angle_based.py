@@ -1,14 +1,74 @@
-from itertools import combinations
-
 import numpy as np
 from sklearn.neighbors import NearestNeighbors
 from sklearn.utils.validation import check_is_fitted
 
 from .base import BaseOutlierDetector
 
+try:
+    from ._abof_numba import get_abof_kernel
+except ImportError:
+    get_abof_kernel = None
+
 __all__ = ['FastABOD']
 
 
+class _NNDescentNeighbors:
+    """Adapter exposing ``pynndescent.NNDescent`` through the subset of the
+    ``NearestNeighbors`` interface used by ``FastABOD``."""
+
+    def __init__(
+        self, metric='minkowski', n_jobs=1, n_neighbors=20, p=2,
+        metric_params=None
+    ):
+        self.metric        = metric
+        self.n_jobs        = n_jobs
+        self.n_neighbors   = n_neighbors
+        self.p             = p
+        self.metric_params = metric_params
+
+    def fit(self, X):
+        from pynndescent import NNDescent
+
+        metric      = self.metric
+        metric_kwds = self.metric_params
+
+        if self.metric == 'minkowski':
+            if self.p == 2:
+                metric = 'euclidean'
+            else:
+                # pynndescent's minkowski defaults to p=2, so the power
+                # parameter has to be forwarded explicitly
+                metric_kwds = dict(self.metric_params or {}, p=self.p)
+
+        # build the index with one extra neighbor since the neighbor graph
+        # includes each training point itself
+        self._index     = NNDescent(
+            X,
+            metric      = metric,
+            metric_kwds = metric_kwds,
+            n_neighbors = self.n_neighbors + 1,
+            n_jobs      = self.n_jobs
+        )
+        self._fit_X     = X
+
+        return self
+
+    def kneighbors(self, X=None, return_distance=True):
+        if X is None:
+            neigh_ind, neigh_dist = self._index.neighbor_graph
+            neigh_ind             = neigh_ind[:, 1:self.n_neighbors + 1]
+            neigh_dist            = neigh_dist[:, 1:self.n_neighbors + 1]
+        else:
+            neigh_ind, neigh_dist = self._index.query(
+                X, k=self.n_neighbors
+            )
+
+        if return_distance:
+            return neigh_dist, neigh_ind
+        else:
+            return neigh_ind
+
+
 class FastABOD(BaseOutlierDetector):
     """Fast Angle-Based Outlier Detector (FastABOD).
 
@@ -18,6 +78,10 @@ class FastABOD(BaseOutlierDetector):
         Tree algorithm to use. Valid algorithms are
         ['kd_tree'|'ball_tree'|'auto'].
 
+    approx : bool, default False
+        If True, compute approximate nearest neighbors with ``pynndescent``
+        instead of an exact search. Requires pynndescent to be installed.
+
     contamination : float, default 0.1
         Proportion of outliers in the data set. Used to define the threshold.
 
@@ -89,11 +153,12 @@ class FastABOD(BaseOutlierDetector):
         return self.estimator_._fit_X
 
     def __init__(
-        self, algorithm='auto', contamination=0.1, leaf_size=30,
-        metric='minkowski', novelty=False, n_jobs=1, n_neighbors=20,
-        p=2, metric_params=None
+        self, algorithm='auto', approx=False, contamination=0.1,
+        leaf_size=30, metric='minkowski', novelty=False, n_jobs=1,
+        n_neighbors=20, p=2, metric_params=None
     ):
         self.algorithm     = algorithm
+        self.approx        = approx
         self.contamination = contamination
         self.leaf_size     = leaf_size
         self.metric        = metric
@@ -126,15 +191,25 @@ class FastABOD(BaseOutlierDetector):
     def _fit(self, X):
         n_samples, _            = X.shape
         self.n_neighbors_       = np.minimum(self.n_neighbors, n_samples - 1)
-        self.estimator_         = NearestNeighbors(
-            algorithm           = self.algorithm,
-            leaf_size           = self.leaf_size,
-            metric              = self.metric,
-            n_jobs              = self.n_jobs,
-            n_neighbors         = self.n_neighbors_,
-            p                   = self.p,
-            metric_params       = self.metric_params
-        ).fit(X)
+
+        if self.approx:
+            self.estimator_     = _NNDescentNeighbors(
+                metric          = self.metric,
+                n_jobs          = self.n_jobs,
+                n_neighbors     = self.n_neighbors_,
+                p               = self.p,
+                metric_params   = self.metric_params
+            ).fit(X)
+        else:
+            self.estimator_     = NearestNeighbors(
+                algorithm       = self.algorithm,
+                leaf_size       = self.leaf_size,
+                metric          = self.metric,
+                n_jobs          = self.n_jobs,
+                n_neighbors     = self.n_neighbors_,
+                p               = self.p,
+                metric_params   = self.metric_params
+            ).fit(X)
         self._anomaly_score_min = np.max(
             self._anomaly_score(X, regularize=False)
         )
@@ -145,7 +220,14 @@ class FastABOD(BaseOutlierDetector):
         abof = self._abof(X)
 
         if regularize:
-            return np.maximum(0., -np.log(abof / self._anomaly_score_min))
+            # _abof returns a freshly allocated buffer, so regularize it in
+            # place instead of allocating a temporary per operation
+            abof /= self._anomaly_score_min
+
+            np.log(abof, out=abof)
+            np.negative(abof, out=abof)
+
+            return np.maximum(0., abof, out=abof)
         else:
             return abof
 
@@ -157,10 +239,54 @@ class FastABOD(BaseOutlierDetector):
         else:
             neigh_ind = self.estimator_.kneighbors(X, return_distance=False)
 
-        return np.var([
-            [
-                (pa @ pb) / (pa @ pa) / (pb @ pb) for pa, pb in combinations(
-                    X_neigh - query_point, 2
-                )
-            ] for query_point, X_neigh in zip(X, self.X_[neigh_ind])
-        ], axis=1)
+        n_samples, _ = X.shape
+        abof         = np.empty(n_samples)
+
+        if get_abof_kernel is not None:
+            kernel = get_abof_kernel(neigh_ind.shape[1])
+
+            kernel(self.X_, X, neigh_ind, abof)
+
+            return abof
+
+        n_neighbors = neigh_ind.shape[1]
+        n_pairs     = n_neighbors * (n_neighbors - 1) // 2
+        diff        = self.X_[neigh_ind] - X[:, np.newaxis]
+        norm_sq     = np.einsum('ijk,ijk->ij', diff, diff)
+
+        # a zero squared norm (duplicate neighbor) divides to inf and
+        # propagates to a nan/inf score with a RuntimeWarning, matching the
+        # scalar implementation and the numba kernel
+        inv_norm_sq = 1. / norm_sq
+
+        # fold the variance of the weighted angle spectrum one batch of
+        # pairs at a time into Welford-style accumulators, so that no
+        # (n_samples, n_pairs) intermediate has to be materialized and a
+        # near-constant spectrum cannot cancel to a negative variance
+        count = 0
+        mean  = np.zeros(n_samples)
+        m2    = np.zeros(n_samples)
+
+        for a in range(n_neighbors - 1):
+            values  = np.einsum('ik,ijk->ij', diff[:, a], diff[:, a + 1:])
+            values *= inv_norm_sq[:, a, np.newaxis]
+            values *= inv_norm_sq[:, a + 1:]
+
+            batch_count = values.shape[1]
+            batch_mean  = np.mean(values, axis=1)
+
+            values     -= batch_mean[:, np.newaxis]
+
+            batch_m2    = np.einsum('ij,ij->i', values, values)
+            delta       = batch_mean - mean
+            total       = count + batch_count
+
+            mean       += batch_count / total * delta
+            m2         += batch_m2
+            m2         += count * batch_count / total * np.square(delta)
+            count       = total
+
+        abof[:]  = m2
+        abof    /= n_pairs
+
+        return abof
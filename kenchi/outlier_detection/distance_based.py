@@ -1,10 +1,16 @@
 import numpy as np
-from sklearn.neighbors import DistanceMetric, NearestNeighbors
+from sklearn.metrics import pairwise_distances_chunked
+from sklearn.neighbors import NearestNeighbors
 from sklearn.utils import check_random_state
 from sklearn.utils.validation import check_is_fitted
 
 from .base import BaseOutlierDetector
 
+try:
+    from ._distance_numba import min_euclidean_dist
+except ImportError:
+    min_euclidean_dist = None
+
 __all__ = ['KNN', 'OneTimeSampling']
 
 
@@ -107,6 +113,14 @@ class KNN(BaseOutlierDetector):
         self.p             = p
         self.metric_params = metric_params
 
+    def _check_array(self, X, **kwargs):
+        # accept float32 as is instead of upcasting: the copy costs a full
+        # pass over the data and the single-precision neighbor search
+        # halves the memory traffic
+        kwargs.setdefault('dtype', [np.float64, np.float32])
+
+        return super()._check_array(X, **kwargs)
+
     def _check_is_fitted(self):
         super()._check_is_fitted()
 
@@ -117,28 +131,88 @@ class KNN(BaseOutlierDetector):
         self.n_neighbors_ = np.maximum(
             1, np.minimum(self.n_neighbors, n_samples - 1)
         )
+
+        # for the default euclidean metric with the brute-force algorithm,
+        # search with squared distances (same neighbor ranking, no square
+        # root per candidate) and take a single square root after reduction
+        self._use_sqeuclidean = (
+            not self.aggregate and self.algorithm == 'brute' and
+            self.metric == 'minkowski' and self.p == 2 and
+            self.metric_params is None
+        )
+
+        metric            = \
+            'sqeuclidean' if self._use_sqeuclidean else self.metric
         self.estimator_   = NearestNeighbors(
             algorithm     = self.algorithm,
             leaf_size     = self.leaf_size,
-            metric        = self.metric,
+            metric        = metric,
             n_jobs        = self.n_jobs,
             n_neighbors   = self.n_neighbors_,
             p             = self.p,
             metric_params = self.metric_params
         ).fit(X)
 
+        # keep a reference to the validated training data so that the
+        # training-data path in _anomaly_score is still taken if the
+        # underlying estimator made a defensive copy
+        self._fit_X_ref   = X
+
+        # cache the training-data neighbor distances so that scoring the
+        # training set again after fit does not repeat the search
+        self._fit_dist, _ = self.estimator_.kneighbors()
+
         return self
 
     def _anomaly_score(self, X):
-        if X is self.X_:
-            dist, _ = self.estimator_.kneighbors()
+        if X is self.X_ or X is self._fit_X_ref:
+            dist = self._fit_dist
+        elif not self.aggregate and self.estimator_._fit_method == 'brute':
+            # only the k-th smallest distance matters, so find it with
+            # introselect on each chunk instead of running the full top-k
+            # search
+            anomaly_score = self._kth_neighbor_dist(
+                X, self.n_neighbors_ - 1
+            )
+
+            if self._use_sqeuclidean:
+                return np.sqrt(anomaly_score)
+
+            return anomaly_score
         else:
             dist, _ = self.estimator_.kneighbors(X)
 
         if self.aggregate:
             return np.sum(dist, axis=1)
-        else:
-            return np.max(dist, axis=1)
+
+        anomaly_score = np.max(dist, axis=1)
+
+        if self._use_sqeuclidean:
+            return np.sqrt(anomaly_score)
+
+        return anomaly_score
+
+    def _kth_neighbor_dist(self, X, kth):
+        """Compute the distance from each sample to its k-th neighbor.
+
+        ``kth`` is the zero-based partition index into the training set.
+        Queries are treated exactly like ``kneighbors(X)``: rows of ``X``
+        that also appear in the training set are not excluded from their
+        own neighborhood. The fitted training data itself never reaches
+        this helper since _anomaly_score serves it from the distances
+        cached in _fit.
+        """
+
+        def reduce_func(dist_chunk, start):
+            return np.partition(dist_chunk, kth, axis=1)[:, kth]
+
+        return np.concatenate(list(pairwise_distances_chunked(
+            X, self.X_,
+            metric      = self.estimator_.effective_metric_,
+            n_jobs      = self.n_jobs,
+            reduce_func = reduce_func,
+            **self.estimator_.effective_metric_params_
+        )))
 
 
 class OneTimeSampling(BaseOutlierDetector):
@@ -201,13 +275,6 @@ class OneTimeSampling(BaseOutlierDetector):
     array([ 1,  1,  1,  1,  1,  1,  1,  1,  1, -1])
     """
 
-    @property
-    def _metric_params(self):
-        if self.metric_params is None:
-            return dict()
-        else:
-            return self.metric_params
-
     def __init__(
         self, contamination=0.1, metric='euclidean', novelty=False,
         n_subsamples=20, random_state=None, metric_params=None
@@ -228,6 +295,8 @@ class OneTimeSampling(BaseOutlierDetector):
             )
 
     def _check_array(self, X, **kwargs):
+        kwargs.setdefault('dtype', [np.float64, np.float32])
+
         X            = super()._check_array(X, **kwargs)
         n_samples, _ = X.shape
 
@@ -256,11 +325,27 @@ class OneTimeSampling(BaseOutlierDetector):
         self.subsamples_ = np.sort(subsamples)
         self.S_          = X[self.subsamples_]
 
-        self.metric_     = DistanceMetric.get_metric(
-            self.metric, **self._metric_params
-        )
+        self.estimator_  = NearestNeighbors(
+            algorithm     = 'brute',
+            metric        = self.metric,
+            n_neighbors   = 1,
+            metric_params = self.metric_params
+        ).fit(self.S_)
 
         return self
 
     def _anomaly_score(self, X):
-        return np.min(self.metric_.pairwise(X, self.S_), axis=1)
+        if (
+            min_euclidean_dist is not None
+            and self.metric == 'euclidean' and not self.metric_params
+        ):
+            n_samples, _ = X.shape
+            dist         = np.empty(n_samples)
+
+            min_euclidean_dist(X, self.S_, dist)
+
+            return dist
+
+        dist, _ = self.estimator_.kneighbors(X)
+
+        return np.ravel(dist)
@@ -1,9 +1,22 @@
 import doctest
 import unittest
+from unittest import mock
 
+import numpy as np
+from kenchi.datasets import make_blobs
 from kenchi.outlier_detection import angle_based
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
 
+try:
+    import numba  # noqa
+except ImportError:
+    numba = None
+
+try:
+    import pynndescent  # noqa
+except ImportError:
+    pynndescent = None
+
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(angle_based))
@@ -17,3 +30,49 @@ class FastABODTest(unittest.TestCase, OutlierDetectorTestMixin):
             self.prepare_data()
 
         self.sut = angle_based.FastABOD(n_neighbors=3)
+
+
+@unittest.skipIf(pynndescent is None, 'pynndescent is not installed')
+class FastABODApproxTest(unittest.TestCase, OutlierDetectorTestMixin):
+    def setUp(self):
+        self.X_train, self.X_test, self.y_train, self.y_test = \
+            self.prepare_data()
+
+        self.sut = angle_based.FastABOD(approx=True, n_neighbors=3)
+
+
+@unittest.skipIf(numba is None, 'numba is not installed')
+class ABOFNumbaKernelTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = make_blobs(
+            centers       = 1,
+            contamination = 0.1,
+            n_features    = 2,
+            n_samples     = 100,
+            random_state  = 0
+        )
+
+    def test_kernel_equal_to_fallback(self):
+        det_kernel = angle_based.FastABOD(n_neighbors=3).fit(self.X)
+
+        with mock.patch.object(angle_based, 'get_abof_kernel', None):
+            det_fallback = angle_based.FastABOD(n_neighbors=3).fit(self.X)
+
+        np.testing.assert_allclose(
+            det_kernel.anomaly_score_, det_fallback.anomaly_score_
+        )
+
+    def test_kernel_equal_to_fallback_on_duplicate_rows(self):
+        # duplicate rows yield zero-norm neighbor differences; the kernel
+        # must accept them like the fallback, propagating inf/nan instead
+        # of raising
+        X = np.vstack([self.X, self.X[:5]])
+
+        det_kernel = angle_based.FastABOD(n_neighbors=3).fit(X)
+
+        with mock.patch.object(angle_based, 'get_abof_kernel', None):
+            det_fallback = angle_based.FastABOD(n_neighbors=3).fit(X)
+
+        np.testing.assert_allclose(
+            det_kernel._abof(X), det_fallback._abof(X), equal_nan=True
+        )
@@ -1,9 +1,17 @@
 import doctest
 import unittest
+from unittest import mock
 
+import numpy as np
+from kenchi.datasets import make_blobs
 from kenchi.outlier_detection import distance_based
 from kenchi.tests.common_tests import OutlierDetectorTestMixin
 
+try:
+    import numba  # noqa
+except ImportError:
+    numba = None
+
 
 def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(distance_based))
@@ -18,6 +26,53 @@ class KNNTest(unittest.TestCase, OutlierDetectorTestMixin):
 
         self.sut = distance_based.KNN(n_neighbors=3)
 
+    def test_fit_predict_float32(self):
+        y_pred = self.sut.fit_predict(self.X_train.astype(np.float32))
+
+        self.assertEqual(y_pred.shape, self.y_train.shape)
+        self.assertEqual(self.sut.X_.dtype, np.float32)
+
+
+class KNNBruteTest(unittest.TestCase, OutlierDetectorTestMixin):
+    def setUp(self):
+        self.X_train, self.X_test, self.y_train, self.y_test = \
+            self.prepare_data()
+
+        self.sut = distance_based.KNN(algorithm='brute', n_neighbors=3)
+
+    def test_anomaly_score_equal_to_default_algorithm(self):
+        default = distance_based.KNN(n_neighbors=3).fit(self.X_train)
+
+        self.sut.fit(self.X_train)
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score_, default.anomaly_score_
+        )
+
+    def test_novelty_anomaly_score_equal_to_default_algorithm(self):
+        default = distance_based.KNN(
+            novelty=True, n_neighbors=3
+        ).fit(self.X_train)
+
+        self.sut.set_params(novelty=True).fit(self.X_train)
+
+        np.testing.assert_allclose(
+            self.sut.anomaly_score(self.X_test),
+            default.anomaly_score(self.X_test)
+        )
+
+    def test_aggregate_anomaly_score_equal_to_default_algorithm(self):
+        default = distance_based.KNN(
+            aggregate=True, n_neighbors=3
+        ).fit(self.X_train)
+        brute   = distance_based.KNN(
+            aggregate=True, algorithm='brute', n_neighbors=3
+        ).fit(self.X_train)
+
+        np.testing.assert_allclose(
+            brute.anomaly_score_, default.anomaly_score_
+        )
+
 
 class OneTimeSamplingTest(unittest.TestCase, OutlierDetectorTestMixin):
     def setUp(self):
@@ -27,3 +82,35 @@ class OneTimeSamplingTest(unittest.TestCase, OutlierDetectorTestMixin):
         self.sut = distance_based.OneTimeSampling(
             n_subsamples=3, random_state=0
         )
+
+    def test_fit_predict_float32(self):
+        y_pred = self.sut.fit_predict(self.X_train.astype(np.float32))
+
+        self.assertEqual(y_pred.shape, self.y_train.shape)
+        self.assertEqual(self.sut.S_.dtype, np.float32)
+
+
+@unittest.skipIf(numba is None, 'numba is not installed')
+class MinEuclideanDistNumbaTest(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = make_blobs(
+            centers       = 1,
+            contamination = 0.1,
+            n_features    = 2,
+            n_samples     = 100,
+            random_state  = 0
+        )
+
+    def test_kernel_equal_to_estimator_path(self):
+        det_kernel = distance_based.OneTimeSampling(
+            n_subsamples=3, random_state=0
+        ).fit(self.X)
+
+        with mock.patch.object(distance_based, 'min_euclidean_dist', None):
+            det_fallback = distance_based.OneTimeSampling(
+                n_subsamples=3, random_state=0
+            ).fit(self.X)
+
+        np.testing.assert_allclose(
+            det_kernel.anomaly_score_, det_fallback.anomaly_score_
+        )
@@ -85,15 +85,68 @@ class Pipeline(_Pipeline):
     def __iter__(self):
         return iter(self.named_steps)
 
+    def __setattr__(self, name, value):
+        # reassigning steps invalidates the fused transform chain and the
+        # cached transform result; this also covers every (re)fit, since
+        # sklearn's Pipeline._fit starts with self.steps = list(self.steps)
+        if name == 'steps':
+            self.__dict__['_transform_chain']     = None
+            self.__dict__['_pre_transform_cache'] = None
+
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+
+        # the fused transform chain is a closure and cannot be pickled, and
+        # the transform cache would serialize the last input array and its
+        # transformed copy for nothing, as its identity key can never match
+        # after unpickling
+        state.pop('_transform_chain', None)
+        state.pop('_pre_transform_cache', None)
+
+        return state
+
+    def _make_transform_chain(self):
+        """Fuse the transforms of the preprocessing steps into a single
+        callable."""
+
+        transforms = tuple(
+            transform.transform for _, transform in self.steps[:-1]
+            if transform is not None
+        )
+
+        def chain(X):
+            for transform in transforms:
+                X = transform(X)
+
+            return X
+
+        self._transform_chain = chain
+
+        return chain
+
     def _pre_transform(self, X):
         if X is None:
             return X
 
-        for _, transform in self.steps[:-1]:
-            if transform is not None:
-                X = transform.transform(X)
+        cache = getattr(self, '_pre_transform_cache', None)
+
+        if cache is not None and cache[0] is X:
+            return cache[1]
+
+        chain = getattr(self, '_transform_chain', None)
+
+        if chain is None:
+            chain = self._make_transform_chain()
+
+        Xt = chain(X)
+
+        # keep the original array alive so that its identity stays unique
+        # for as long as the cache entry exists
+        self._pre_transform_cache = (X, Xt)
 
-        return X
+        return Xt
 
     @if_delegate_has_method(delegate='_final_estimator')
     def score_samples(self, X=None):
@@ -135,7 +188,7 @@ class Pipeline(_Pipeline):
 
         X = self._pre_transform(X)
 
-        return self._final_estimator.anomaly_score(X, **kwargs)
+        return self.steps[-1][1].anomaly_score(X, **kwargs)
 
     @if_delegate_has_method(delegate='_final_estimator')
     def featurewise_anomaly_score(self, X):
@@ -155,7 +208,7 @@ class Pipeline(_Pipeline):
 
         X = self._pre_transform(X)
 
-        return self._final_estimator.featurewise_anomaly_score(X)
+        return self.steps[-1][1].featurewise_anomaly_score(X)
 
     def to_pickle(self, filename, **kwargs):
         """Persist a pipeline object.
@@ -233,7 +286,7 @@ class Pipeline(_Pipeline):
 
         X = self._pre_transform(X)
 
-        return self._final_estimator.plot_anomaly_score(X, **kwargs)
+        return self.steps[-1][1].plot_anomaly_score(X, **kwargs)
 
     @if_delegate_has_method(delegate='_final_estimator')
     def plot_roc_curve(self, X, y, **kwargs):
@@ -277,7 +330,7 @@ class Pipeline(_Pipeline):
 
         X = self._pre_transform(X)
 
-        return self._final_estimator.plot_roc_curve(X, y, **kwargs)
+        return self.steps[-1][1].plot_roc_curve(X, y, **kwargs)
 
     @property
     def plot_graphical_model(self):
@@ -310,7 +363,7 @@ class Pipeline(_Pipeline):
             Axes on which the plot was drawn.
         """
 
-        return self._final_estimator.plot_graphical_model
+        return self.steps[-1][1].plot_graphical_model
 
     @property
     def plot_partial_corrcoef(self):
@@ -343,4 +396,4 @@ class Pipeline(_Pipeline):
             Axes on which the plot was drawn.
         """
 
-        return self._final_estimator.plot_partial_corrcoef
+        return self.steps[-1][1].plot_partial_corrcoef
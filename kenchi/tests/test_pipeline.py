@@ -32,6 +32,31 @@ class PipelineTest(unittest.TestCase, OutlierDetectorTestMixin):
 
         self.assertEqual(anomaly_score.shape, self.X_test.shape)
 
+    def test_pre_transform_cache(self):
+        self.sut.fit(self.X_train)
+        self.sut.anomaly_score(self.X_test)
+
+        cache = self.sut._pre_transform_cache
+
+        self.assertIs(cache[0], self.X_test)
+        self.assertIs(self.sut._pre_transform(self.X_test), cache[1])
+
+    def test_pre_transform_cache_invalidated_on_refit(self):
+        self.sut.fit(self.X_train)
+        self.sut.anomaly_score(self.X_test)
+        self.sut.fit(self.X_train)
+
+        self.assertIsNone(self.sut._pre_transform_cache)
+
+    def test_pre_transform_cache_not_pickled(self):
+        self.sut.fit(self.X_train)
+        self.sut.anomaly_score(self.X_test)
+
+        state = self.sut.__getstate__()
+
+        self.assertNotIn('_pre_transform_cache', state)
+        self.assertNotIn('_transform_chain', state)
+
     @if_matplotlib
     def test_plot_graphical_model(self):
         import matplotlib.pyplot as plt